@@ -8,6 +8,8 @@ import csv
 from datetime import datetime
 import glob
 
+from report_dataset import append_records, TEST_DURATIONS
+
 def parse_junit_xml(xml_file):
     """Parsea un archivo XML de JUnit y retorna los resultados"""
     try:
@@ -83,6 +85,8 @@ def generate_backend_csv_report():
             writer = csv.writer(f)
             writer.writerow(['Fecha', 'Total Tests', 'Pasados', 'Fallidos', 'Errores', 'Omitidos', 'Tiempo Total'])
             writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 0, 0, 0, 0, 0, 0.0])
+        # Eliminar del dataset los resultados de una ejecución anterior del mismo build
+        append_records(TEST_DURATIONS, [], 'backend')
         return
     
     all_results = {
@@ -136,6 +140,18 @@ def generate_backend_csv_report():
                 round(test_case['time'], 3)
             ])
     
+    # Exportar duraciones por test al dataset columnar
+    append_records(TEST_DURATIONS, [
+        {
+            'component': 'backend',
+            'suite': test_case['class'],
+            'test': test_case['test'],
+            'status': test_case['status'],
+            'duration_ms': float(test_case['time']) * 1000
+        }
+        for test_case in all_results['test_cases']
+    ], 'backend')
+    
     print(f"Reporte CSV generado: {csv_file}")
     print(f"Reporte detallado generado: {detailed_csv}")
 
@@ -7,6 +7,8 @@ import csv
 from datetime import datetime
 import glob
 
+from report_dataset import append_records, TEST_SUMMARY
+
 def read_csv_summary(csv_file):
     """Lee un archivo CSV de resumen y retorna los datos"""
     try:
@@ -136,6 +138,30 @@ def generate_consolidated_report():
     
     print(f"Reporte consolidado generado: {consolidated_csv}")
     
+    # Exportar resumen por componente al dataset columnar
+    summary_records = []
+    if backend_data:
+        summary_records.append({
+            'component': 'backend',
+            'total': int(backend_data.get('Total Tests', 0)),
+            'passed': int(backend_data.get('Pasados', 0)),
+            'failed': int(backend_data.get('Fallidos', 0)),
+            'errors': int(backend_data.get('Errores', 0)),
+            'skipped': int(backend_data.get('Omitidos', 0)),
+            'time_s': float(backend_data.get('Tiempo Total (s)', 0) or 0)
+        })
+    if frontend_data:
+        summary_records.append({
+            'component': 'frontend',
+            'total': int(frontend_data.get('Total Tests', 0)),
+            'passed': int(frontend_data.get('Pasados', 0)),
+            'failed': int(frontend_data.get('Fallidos', 0)),
+            'errors': 0,
+            'skipped': int(frontend_data.get('Omitidos', 0)),
+            'time_s': None
+        })
+    append_records(TEST_SUMMARY, summary_records, 'consolidated')
+    
     # Mostrar resumen en consola
     print("\n=== RESUMEN DE PRUEBAS ===")
     if backend_data:
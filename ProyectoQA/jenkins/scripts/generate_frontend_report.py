@@ -8,6 +8,8 @@ import csv
 from datetime import datetime
 import glob
 
+from report_dataset import append_records, TEST_DURATIONS, COVERAGE
+
 def parse_karma_json(json_file):
     """Parsea un archivo JSON de resultados de Karma"""
     try:
@@ -155,6 +157,25 @@ def generate_frontend_csv_report():
                     round(test_case['time'], 2)
                 ])
     
+    # Exportar duraciones por test y cobertura al dataset columnar
+    append_records(TEST_DURATIONS, [
+        {
+            'component': 'frontend',
+            'suite': test_case['suite'],
+            'test': test_case['test'],
+            'status': test_case['status'],
+            'duration_ms': float(test_case['time'])
+        }
+        for test_case in karma_results['test_cases']
+    ], 'frontend')
+    append_records(COVERAGE, [{
+        'component': 'frontend',
+        'lines': float(coverage_results['lines']),
+        'statements': float(coverage_results['statements']),
+        'functions': float(coverage_results['functions']),
+        'branches': float(coverage_results['branches'])
+    }] if coverage_results else [], 'frontend')
+    
     print(f"Reporte CSV generado: {csv_file}")
     if coverage_results:
         print(f"Reporte de cobertura generado: {coverage_csv}")
@@ -7,10 +7,112 @@ import sys
 import csv
 import json
 import os
+import re
+import html
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from report_dataset import append_records, LOAD_TEST_ENDPOINTS, LOAD_TEST_WINDOWS
+
+# Número máximo de firmas de error distintas que se conservan por endpoint.
+# La memoria usada es fija sin importar cuántos mensajes distintos devuelva el backend.
+MAX_ERROR_SIGNATURES = 20
+# Longitud máxima de una firma de error (evita que mensajes enormes crezcan sin límite)
+MAX_SIGNATURE_LENGTH = 200
+# Partes variables de los mensajes (UUIDs, hexadecimales, números) que se reemplazan por
+# marcadores para que los mensajes con IDs, montos o timestamps se agrupen en una sola firma
+SIGNATURE_PLACEHOLDERS = [
+    (re.compile(r'\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b'), '<uuid>'),
+    (re.compile(r'\b(?:0x[0-9a-fA-F]+|(?=[0-9a-fA-F]*\d)(?=[0-9a-fA-F]*[a-fA-F])[0-9a-fA-F]{8,})\b'), '<id>'),
+    (re.compile(r'\d+(?:[.,]\d+)*'), '<n>')
+]
+# Tamaño de ventana (segundos) para las series temporales del dashboard
+TIME_SERIES_WINDOW_SECONDS = 1
+# Máximo de ventanas que se generan al rellenar huecos sin muestras (24 h de ventanas de 1s).
+# Protege contra timestamps corruptos que harían el rango de tiempo enorme.
+MAX_FILLED_WINDOWS = 86400
+# Puntos máximos por serie en los gráficos HTML (downsampling min/max por buckets)
+MAX_CHART_POINTS = 500
+
+class ErrorSignatureTracker:
+    """
+    Cuenta las firmas de error más frecuentes usando el algoritmo Space-Saving.
+
+    Mantiene como máximo `capacity` firmas. Cuando llega una firma nueva y la
+    estructura está llena, reemplaza la de menor conteo y hereda ese conteo como
+    sobreestimación máxima ('max_error'). Así las firmas frecuentes siempre
+    aparecen, con un conteo que nunca subestima el real.
+    """
+
+    def __init__(self, capacity: int = MAX_ERROR_SIGNATURES):
+        self.capacity = capacity
+        self.entries: Dict[str, Dict] = {}
+
+    def add(self, signature: str, timestamp: Optional[int] = None):
+        entry = self.entries.get(signature)
+        if entry is not None:
+            entry['count'] += 1
+            if timestamp is not None:
+                if entry['first_seen'] is None or timestamp < entry['first_seen']:
+                    entry['first_seen'] = timestamp
+                if entry['last_seen'] is None or timestamp > entry['last_seen']:
+                    entry['last_seen'] = timestamp
+            return
+        
+        min_count = 0
+        if len(self.entries) >= self.capacity:
+            # Reemplazar la firma con menor conteo
+            victim = min(self.entries, key=lambda key: self.entries[key]['count'])
+            min_count = self.entries.pop(victim)['count']
+        
+        self.entries[signature] = {
+            'count': min_count + 1,
+            'max_error': min_count,
+            'first_seen': timestamp,
+            'last_seen': timestamp
+        }
+
+    def top(self, limit: Optional[int] = None) -> List[tuple]:
+        """
+        Retorna las firmas ordenadas por conteo descendente como (firma, entrada).
+        """
+        ordered = sorted(self.entries.items(), key=lambda item: item[1]['count'], reverse=True)
+        return ordered[:limit] if limit is not None else ordered
+
+def normalize_message(message: str) -> str:
+    """
+    Reemplaza las partes variables de un mensaje (UUIDs, hexadecimales, números)
+    por marcadores y colapsa los espacios.
+    """
+    message = ' '.join(message.split())
+    for pattern, placeholder in SIGNATURE_PLACEHOLDERS:
+        message = pattern.sub(placeholder, message)
+    return message
+
+def build_error_signature(result: Dict) -> str:
+    """
+    Construye la firma de error de un resultado fallido a partir de
+    responseCode, responseMessage y failureMessage. Los mensajes se normalizan
+    para que los errores de la misma clase compartan firma.
+    """
+    code = (result.get('responseCode') or '').strip()
+    message = normalize_message(result.get('responseMessage') or '')
+    failure = normalize_message(result.get('failureMessage') or '')
+    
+    signature = f"{code} {message}".strip() or 'Sin código'
+    if failure:
+        signature = f"{signature} | {failure}"
+    return signature[:MAX_SIGNATURE_LENGTH]
+
+def format_timestamp(timestamp: Optional[int]) -> str:
+    """
+    Formatea un timestamp de JMeter (epoch en milisegundos).
+    """
+    if timestamp is None:
+        return 'N/A'
+    return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
+
 def parse_jtl_file(jtl_file: str) -> List[Dict]:
     """
     Parsea el archivo JTL de JMeter y retorna una lista de resultados.
@@ -47,6 +149,7 @@ def calculate_metrics(results: List[Dict]) -> Dict:
     total_requests = len(results)
     
     endpoint_stats = {}
+    windows = {}
     
     for result in results:
         try:
@@ -54,6 +157,11 @@ def calculate_metrics(results: List[Dict]) -> Dict:
             elapsed = float(result.get('elapsed', 0))
             response_times.append(elapsed)
             
+            try:
+                timestamp = int(result.get('timeStamp'))
+            except (TypeError, ValueError):
+                timestamp = None
+            
             # Success/Error
             success = result.get('success', 'false').lower() == 'true'
             if success:
@@ -74,20 +182,33 @@ def calculate_metrics(results: List[Dict]) -> Dict:
                     'error': 0,
                     'total_time': 0,
                     'min_time': float('inf'),
-                    'max_time': 0
+                    'max_time': 0,
+                    'response_times': [],
+                    'error_signatures': ErrorSignatureTracker()
                 }
             
             endpoint_stats[label]['count'] += 1
             endpoint_stats[label]['total_time'] += elapsed
+            endpoint_stats[label]['response_times'].append(elapsed)
             if success:
                 endpoint_stats[label]['success'] += 1
             else:
                 endpoint_stats[label]['error'] += 1
+                endpoint_stats[label]['error_signatures'].add(build_error_signature(result), timestamp)
             
             if elapsed < endpoint_stats[label]['min_time']:
                 endpoint_stats[label]['min_time'] = elapsed
             if elapsed > endpoint_stats[label]['max_time']:
                 endpoint_stats[label]['max_time'] = elapsed
+            
+            # Ventanas de tiempo para las series del dashboard (después de todo el parseo que puede fallar)
+            if timestamp is not None:
+                window_key = timestamp // (TIME_SERIES_WINDOW_SECONDS * 1000)
+                if window_key not in windows:
+                    windows[window_key] = {'elapsed': [], 'errors': 0}
+                windows[window_key]['elapsed'].append(elapsed)
+                if not success:
+                    windows[window_key]['errors'] += 1
                 
         except (ValueError, KeyError) as e:
             continue
@@ -106,7 +227,8 @@ def calculate_metrics(results: List[Dict]) -> Dict:
         'p95_response_time': response_times[int(len(response_times) * 0.95)] if len(response_times) > 0 else 0,
         'p99_response_time': response_times[int(len(response_times) * 0.99)] if len(response_times) > 0 else 0,
         'total_bytes': total_bytes,
-        'endpoint_stats': endpoint_stats
+        'endpoint_stats': endpoint_stats,
+        'time_series': build_time_series(windows, TIME_SERIES_WINDOW_SECONDS)
     }
     
     # Calcular estadísticas agregadas por endpoint
@@ -114,9 +236,113 @@ def calculate_metrics(results: List[Dict]) -> Dict:
         stats['avg_time'] = stats['total_time'] / stats['count'] if stats['count'] > 0 else 0
         stats['error_percentage'] = (stats['error'] / stats['count'] * 100) if stats['count'] > 0 else 0
         stats['success_percentage'] = (stats['success'] / stats['count'] * 100) if stats['count'] > 0 else 0
+        
+        times = sorted(stats.pop('response_times'))
+        stats['median_time'] = times[len(times) // 2] if times else 0
+        stats['p95_time'] = times[int(len(times) * 0.95)] if times else 0
+        stats['p99_time'] = times[int(len(times) * 0.99)] if times else 0
     
     return metrics
 
+def build_time_series(windows: Dict, window_seconds: int) -> List[Dict]:
+    """
+    Convierte las ventanas de tiempo en una serie ordenada con percentiles,
+    throughput y porcentaje de errores por ventana. Las ventanas sin muestras se
+    incluyen con throughput 0 y percentiles/errores en None, para que las pausas
+    del backend sean visibles en el dashboard.
+    """
+    series = []
+    if not windows:
+        return series
+    
+    first_key, last_key = select_time_series_range(windows)
+    excluded = sum(len(window['elapsed']) for key, window in windows.items()
+                   if key < first_key or key > last_key)
+    if excluded:
+        print(f"Advertencia: {excluded} muestras con timestamp atípico excluidas de las series temporales")
+    
+    if last_key - first_key + 1 <= MAX_FILLED_WINDOWS:
+        window_keys = range(first_key, last_key + 1)
+    else:
+        print("Advertencia: rango de tiempo demasiado amplio, no se rellenan las ventanas sin muestras")
+        window_keys = sorted(key for key in windows if first_key <= key <= last_key)
+    
+    for window_key in window_keys:
+        if window_key not in windows:
+            series.append({
+                'timestamp': window_key * window_seconds * 1000,
+                'requests': 0,
+                'errors': 0,
+                'throughput': 0.0,
+                'error_percentage': None,
+                'p50_response_time': None,
+                'p95_response_time': None,
+                'p99_response_time': None
+            })
+            continue
+        
+        window = windows[window_key]
+        times = sorted(window['elapsed'])
+        count = len(times)
+        series.append({
+            'timestamp': window_key * window_seconds * 1000,
+            'requests': count,
+            'errors': window['errors'],
+            'throughput': count / window_seconds,
+            'error_percentage': window['errors'] / count * 100,
+            'p50_response_time': times[count // 2],
+            'p95_response_time': times[int(count * 0.95)],
+            'p99_response_time': times[int(count * 0.99)]
+        })
+    return series
+
+def select_time_series_range(windows: Dict) -> tuple:
+    """
+    Retorna el rango (primera, última) de ventanas a graficar, descartando ventanas
+    atípicas muy alejadas del resto (por ejemplo un timeStamp 0 o en segundos).
+    Usa el rango intercuartílico de las ventanas con muestras.
+    """
+    keys = sorted(windows)
+    q1 = keys[len(keys) // 4]
+    q3 = keys[(len(keys) * 3) // 4]
+    margin = 10 * (q3 - q1) + 60
+    in_range = [key for key in keys if q1 - margin <= key <= q3 + margin]
+    return in_range[0], in_range[-1]
+
+def downsample_min_max(points: List[tuple], max_points: int) -> List[tuple]:
+    """
+    Reduce una serie de puntos (x, y) a como máximo `max_points` puntos. Los puntos
+    con y=None marcan huecos (ventanas sin muestras) y se conservan como cortes.
+
+    Si la serie cabe en el presupuesto solo se colapsan los huecos consecutivos. Si no,
+    se divide en max_points/2 buckets y de cada uno se conservan el mínimo y el máximo
+    (en orden temporal), lo que mantiene visibles los picos; un bucket sin ningún
+    valor se convierte en un corte.
+    """
+    values = sum(1 for point in points if point[1] is not None)
+    if values <= max_points:
+        reduced = []
+        for point in points:
+            if point[1] is None and (not reduced or reduced[-1][1] is None):
+                continue
+            reduced.append(point)
+        return reduced
+    
+    bucket_count = max(max_points // 2, 1)
+    bucket_size = len(points) / bucket_count
+    reduced = []
+    for i in range(bucket_count):
+        bucket = points[int(i * bucket_size):int((i + 1) * bucket_size)]
+        valid = [point for point in bucket if point[1] is not None]
+        if not valid:
+            if reduced and reduced[-1][1] is not None:
+                reduced.append((bucket[0][0], None))
+            continue
+        low = min(valid, key=lambda point: point[1])
+        high = max(valid, key=lambda point: point[1])
+        reduced.extend(sorted({low, high}, key=lambda point: point[0]))
+    return reduced
+
 def generate_csv_report(metrics: Dict, output_file: str):
     """
     Genera un reporte CSV consolidado.
@@ -158,9 +384,239 @@ def generate_csv_report(metrics: Dict, output_file: str):
                 f"{stats['min_time']:.2f}",
                 f"{stats['max_time']:.2f}"
             ])
+        
+        # Errores principales por endpoint
+        writer.writerow([])
+        writer.writerow(['Errores Principales por Endpoint'])
+        writer.writerow(['Endpoint', 'Firma de Error', 'Ocurrencias', 'Sobreestimación Máxima',
+                        'Primera Aparición', 'Última Aparición'])
+        
+        for endpoint, stats in metrics['endpoint_stats'].items():
+            for signature, entry in stats['error_signatures'].top():
+                writer.writerow([
+                    endpoint,
+                    signature,
+                    entry['count'],
+                    entry['max_error'],
+                    format_timestamp(entry['first_seen']),
+                    format_timestamp(entry['last_seen'])
+                ])
     
     print(f"Reporte CSV generado: {output_file}")
 
+CHART_COLORS = ['#1f77b4', '#ff7f0e', '#d62728', '#2ca02c', '#9467bd']
+
+def render_svg_chart(title: str, unit: str, series: Dict[str, List[tuple]],
+                     width: int = 900, height: int = 260) -> str:
+    """
+    Genera un gráfico de líneas SVG inline. `series` mapea el nombre de cada
+    serie a sus puntos (timestamp_ms, valor), ya reducidos. Los puntos con valor
+    None cortan la línea (un solo <path> con movimientos M) y los puntos aislados
+    se dibujan como marcadores.
+    """
+    margin_left, margin_right, margin_top, margin_bottom = 60, 20, 30, 40
+    plot_width = width - margin_left - margin_right
+    plot_height = height - margin_top - margin_bottom
+    
+    all_points = [point for points in series.values() for point in points if point[1] is not None]
+    if not all_points:
+        return f'<p>{html.escape(title)}: sin datos</p>'
+    
+    min_x = min(point[0] for point in all_points)
+    max_x = max(point[0] for point in all_points)
+    max_y = max(point[1] for point in all_points) or 1
+    span_x = (max_x - min_x) or 1
+    
+    def to_svg(point):
+        x = margin_left + (point[0] - min_x) / span_x * plot_width
+        y = margin_top + plot_height - point[1] / max_y * plot_height
+        return f"{x:.1f},{y:.1f}"
+    
+    parts = [
+        f'<svg viewBox="0 0 {width} {height}" width="100%" xmlns="http://www.w3.org/2000/svg">',
+        f'<text x="{margin_left}" y="18" class="chart-title">{html.escape(title)}</text>'
+    ]
+    
+    # Ejes y líneas guía
+    for fraction in (0, 0.5, 1):
+        y = margin_top + plot_height - fraction * plot_height
+        parts.append(f'<line x1="{margin_left}" y1="{y:.1f}" x2="{margin_left + plot_width}" '
+                     f'y2="{y:.1f}" class="grid"/>')
+        parts.append(f'<text x="{margin_left - 6}" y="{y + 4:.1f}" text-anchor="end" class="axis">'
+                     f'{max_y * fraction:.1f} {html.escape(unit)}</text>')
+    for x, value in ((margin_left, min_x), (margin_left + plot_width, max_x)):
+        label = datetime.fromtimestamp(value / 1000).strftime('%H:%M:%S')
+        parts.append(f'<text x="{x}" y="{height - 15}" text-anchor="middle" class="axis">{label}</text>')
+    
+    # Series
+    for index, (name, points) in enumerate(series.items()):
+        color = CHART_COLORS[index % len(CHART_COLORS)]
+        
+        # Separar en segmentos continuos: los de un punto se dibujan como marcadores
+        segments = [[]]
+        for point in points:
+            if point[1] is None:
+                segments.append([])
+            else:
+                segments[-1].append(point)
+        
+        commands = []
+        for segment in segments:
+            if len(segment) == 1:
+                x, y = to_svg(segment[0]).split(',')
+                parts.append(f'<circle cx="{x}" cy="{y}" r="2" fill="{color}"/>')
+            elif segment:
+                commands.append('M' + ' L'.join(to_svg(point) for point in segment))
+        if commands:
+            path = ' '.join(commands)
+            parts.append(f'<path fill="none" stroke="{color}" stroke-width="1.5" d="{path}"/>')
+        legend_x = margin_left + plot_width - 110 * (len(series) - index)
+        parts.append(f'<rect x="{legend_x}" y="8" width="10" height="10" fill="{color}"/>')
+        parts.append(f'<text x="{legend_x + 14}" y="17" class="axis">{html.escape(name)}</text>')
+    
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+def generate_html_report(metrics: Dict, output_file: str, max_points: int = MAX_CHART_POINTS):
+    """
+    Genera un dashboard HTML autocontenido (sin dependencias externas) con
+    series temporales reducidas a `max_points` puntos y tablas por endpoint.
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    time_series = metrics.get('time_series', [])
+    
+    def series_points(key):
+        points = [(window['timestamp'], window[key]) for window in time_series]
+        return downsample_min_max(points, max_points)
+    
+    charts = [
+        render_svg_chart('Tiempo de respuesta por percentil', 'ms', {
+            'P50': series_points('p50_response_time'),
+            'P95': series_points('p95_response_time'),
+            'P99': series_points('p99_response_time')
+        }),
+        render_svg_chart('Throughput', 'req/s', {'Throughput': series_points('throughput')}),
+        render_svg_chart('Porcentaje de errores', '%', {'Errores': series_points('error_percentage')})
+    ]
+    
+    summary_rows = [
+        ('Total de Requests', metrics['total_requests']),
+        ('Requests Exitosos', metrics['success_count']),
+        ('Requests con Error', metrics['error_count']),
+        ('Porcentaje de Errores (%)', f"{metrics['error_percentage']:.2f}"),
+        ('Tiempo de Respuesta Promedio (ms)', f"{metrics['avg_response_time']:.2f}"),
+        ('Tiempo de Respuesta Mediano (ms)', f"{metrics['median_response_time']:.2f}"),
+        ('Percentil 95 (ms)', f"{metrics['p95_response_time']:.2f}"),
+        ('Percentil 99 (ms)', f"{metrics['p99_response_time']:.2f}"),
+        ('Total de Bytes', metrics['total_bytes'])
+    ]
+    summary_html = '\n'.join(
+        f'<tr><td>{html.escape(name)}</td><td>{value}</td></tr>' for name, value in summary_rows
+    )
+    
+    endpoint_html = '\n'.join(
+        f"<tr><td>{html.escape(endpoint)}</td><td>{stats['count']}</td><td>{stats['success']}</td>"
+        f"<td>{stats['error']}</td><td>{stats['error_percentage']:.2f}</td><td>{stats['avg_time']:.2f}</td>"
+        f"<td>{stats['min_time']:.2f}</td><td>{stats['max_time']:.2f}</td><td>{stats['median_time']:.2f}</td>"
+        f"<td>{stats['p95_time']:.2f}</td><td>{stats['p99_time']:.2f}</td></tr>"
+        for endpoint, stats in metrics['endpoint_stats'].items()
+    )
+    
+    error_html = '\n'.join(
+        f"<tr><td>{html.escape(endpoint)}</td><td>{html.escape(signature)}</td><td>{entry['count']}</td>"
+        f"<td>{entry['max_error']}</td><td>{entry['count'] - entry['max_error']}</td>"
+        f"<td>{format_timestamp(entry['first_seen'])}</td><td>{format_timestamp(entry['last_seen'])}</td></tr>"
+        for endpoint, stats in metrics['endpoint_stats'].items()
+        for signature, entry in stats['error_signatures'].top()
+    )
+    
+    content = f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Reporte de Pruebas de Carga</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; font-size: 13px; }}
+th {{ background: #f0f0f0; }}
+.chart-title {{ font-size: 14px; font-weight: bold; }}
+.axis {{ font-size: 11px; fill: #555; }}
+.grid {{ stroke: #ddd; stroke-width: 1; }}
+</style>
+</head>
+<body>
+<h1>Reporte de Pruebas de Carga</h1>
+<p>Generado: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} &middot; Ventanas: {len(time_series)}
+de {TIME_SERIES_WINDOW_SECONDS}s (máx. {max_points} puntos por serie)</p>
+<h2>Resumen</h2>
+<table>
+<tr><th>Métrica</th><th>Valor</th></tr>
+{summary_html}
+</table>
+<h2>Series Temporales</h2>
+{''.join(f'<div>{chart}</div>' for chart in charts)}
+<h2>Estadísticas por Endpoint</h2>
+<table>
+<tr><th>Endpoint</th><th>Total Requests</th><th>Exitosos</th><th>Errores</th><th>Error %</th>
+<th>Tiempo Promedio (ms)</th><th>Tiempo Mín (ms)</th><th>Tiempo Máx (ms)</th>
+<th>Mediana (ms)</th><th>P95 (ms)</th><th>P99 (ms)</th></tr>
+{endpoint_html}
+</table>
+<h2>Errores Principales por Endpoint</h2>
+<table>
+<tr><th>Endpoint</th><th>Firma de Error</th><th>Ocurrencias</th><th>Sobreestimación Máxima</th>
+<th>Mínimo Garantizado</th><th>Primera Aparición</th><th>Última Aparición</th></tr>
+{error_html}
+</table>
+</body>
+</html>
+"""
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    
+    print(f"Dashboard HTML generado: {output_file}")
+
+def export_to_dataset(metrics: Dict):
+    """
+    Agrega las estadísticas por endpoint y las series por ventana al dataset columnar.
+    """
+    endpoint_records = [
+        {
+            'label': endpoint,
+            'count': stats['count'],
+            'success': stats['success'],
+            'error': stats['error'],
+            'error_percentage': float(stats['error_percentage']),
+            'avg_time': float(stats['avg_time']),
+            'min_time': float(stats['min_time']),
+            'max_time': float(stats['max_time']),
+            'median_time': float(stats['median_time']),
+            'p95_time': float(stats['p95_time']),
+            'p99_time': float(stats['p99_time'])
+        }
+        for endpoint, stats in metrics['endpoint_stats'].items()
+    ]
+    window_records = [
+        {
+            'timestamp': window['timestamp'],
+            'requests': window['requests'],
+            'errors': window['errors'],
+            'throughput': float(window['throughput']),
+            'error_percentage': window['error_percentage'],
+            'p50_response_time': window['p50_response_time'],
+            'p95_response_time': window['p95_response_time'],
+            'p99_response_time': window['p99_response_time']
+        }
+        for window in metrics.get('time_series', [])
+    ]
+    
+    append_records(LOAD_TEST_ENDPOINTS, endpoint_records, 'load_test')
+    append_records(LOAD_TEST_WINDOWS, window_records, 'load_test')
+
 def validate_thresholds(metrics: Dict, thresholds: Dict) -> List[str]:
     """
     Valida métricas contra umbrales y retorna lista de advertencias.
@@ -207,6 +663,13 @@ def main():
     csv_file = os.path.join(output_dir, f"load_test_summary_{timestamp}.csv")
     generate_csv_report(metrics, csv_file)
     
+    # Generar dashboard HTML
+    html_file = os.path.join(output_dir, f"load_test_dashboard_{timestamp}.html")
+    generate_html_report(metrics, html_file)
+    
+    # Exportar al dataset columnar
+    export_to_dataset(metrics)
+    
     # Mostrar resumen
     print("\n=== RESUMEN DE PRUEBAS DE CARGA ===")
     print(f"Total de Requests: {metrics['total_requests']}")
@@ -221,6 +684,8 @@ def main():
         print(f"  Requests: {stats['count']}, "
               f"Promedio: {stats['avg_time']:.2f}ms, "
               f"Errores: {stats['error_percentage']:.2f}%")
+        for signature, entry in stats['error_signatures'].top(3):
+            print(f"    [{entry['count']} (mín. garantizado {entry['count'] - entry['max_error']})] {signature}")
     
     # Validar umbrales (si se proporcionan)
     config_file = os.path.join(os.path.dirname(jtl_file), '..', 'load-test-config.properties')
@@ -243,6 +708,7 @@ def main():
                 print("\n✓ Todas las métricas están dentro de los umbrales")
     
     print(f"\nReporte completo guardado en: {csv_file}")
+    print(f"Dashboard HTML guardado en: {html_file}")
 
 if __name__ == '__main__':
     main()
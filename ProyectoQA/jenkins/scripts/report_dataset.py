@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Dataset columnar (Parquet) con los resultados de todos los reportes, particionado por job y build.
+
+Cada script de reporte agrega sus resultados con `append_records`. Los datos quedan en
+<dataset_dir>/<tabla>/job=<JOB_NAME>/build=<n>/part-<origen>.parquet, de modo que las
+consultas de tendencia solo leen las columnas, jobs y builds que necesitan. Volver a
+ejecutar un reporte en el mismo build reemplaza su archivo en lugar de duplicar filas.
+
+Uso (consultas):
+    python report_dataset.py --list
+    python report_dataset.py <tabla> [--columns c1,c2] [--where "col=valor"] [--job JOB] [--last-builds N]
+
+Ejemplo: p95 del endpoint "buy" en los últimos 200 builds de un job
+    python report_dataset.py load_test_endpoints --columns build,p95_time --where "label=buy" --job stock-simulator/main --last-builds 200
+
+Requiere pyarrow (pip install pyarrow). Si no está instalado, la exportación se omite.
+"""
+import os
+import re
+import sys
+import csv
+import argparse
+from urllib.parse import quote, unquote
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Tablas del dataset
+LOAD_TEST_ENDPOINTS = 'load_test_endpoints'
+LOAD_TEST_WINDOWS = 'load_test_windows'
+TEST_DURATIONS = 'test_durations'
+COVERAGE = 'coverage'
+TEST_SUMMARY = 'test_summary'
+
+# Columnas y tipos de cada tabla. Un esquema fijo mantiene los archivos de todos
+# los builds compatibles entre sí (por ejemplo, cuando un valor es None en un build).
+TABLE_COLUMNS = {
+    LOAD_TEST_ENDPOINTS: {
+        'label': 'string', 'count': 'int64', 'success': 'int64', 'error': 'int64',
+        'error_percentage': 'double', 'avg_time': 'double', 'min_time': 'double',
+        'max_time': 'double', 'median_time': 'double', 'p95_time': 'double', 'p99_time': 'double'
+    },
+    LOAD_TEST_WINDOWS: {
+        'timestamp': 'int64', 'requests': 'int64', 'errors': 'int64', 'throughput': 'double',
+        'error_percentage': 'double', 'p50_response_time': 'double',
+        'p95_response_time': 'double', 'p99_response_time': 'double'
+    },
+    TEST_DURATIONS: {
+        'component': 'string', 'suite': 'string', 'test': 'string', 'status': 'string',
+        'duration_ms': 'double'
+    },
+    COVERAGE: {
+        'component': 'string', 'lines': 'double', 'statements': 'double',
+        'functions': 'double', 'branches': 'double'
+    },
+    TEST_SUMMARY: {
+        'component': 'string', 'total': 'int64', 'passed': 'int64', 'failed': 'int64',
+        'errors': 'int64', 'skipped': 'int64', 'time_s': 'double'
+    }
+}
+# Columnas comunes agregadas a todos los registros
+COMMON_COLUMNS = {'recorded_at': 'string'}
+# Columnas de partición (parte de la ruta, no de los archivos)
+PARTITION_COLUMNS = {'job': 'string', 'build': 'int64'}
+
+DEFAULT_DATASET_DIR = os.path.join(os.path.expanduser('~'), 'report-dataset')
+
+WHERE_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.*?)\s*$')
+
+def get_dataset_dir() -> str:
+    """Directorio raíz del dataset (variable de entorno REPORT_DATASET_DIR)"""
+    return os.environ.get('REPORT_DATASET_DIR', DEFAULT_DATASET_DIR)
+
+def get_job_name() -> str:
+    """Nombre del job de Jenkins ('local' en ejecuciones locales)"""
+    return os.environ.get('JOB_NAME', 'local')
+
+def get_build_number() -> int:
+    """Número de build de Jenkins (0 en ejecuciones locales, que se reemplazan en cada ejecución)"""
+    try:
+        return int(os.environ.get('BUILD_NUMBER', 0))
+    except ValueError:
+        return 0
+
+def get_schema(table: str, include_partitions: bool = False):
+    """Esquema de pyarrow de una tabla (opcionalmente con las columnas de partición)"""
+    columns = dict(TABLE_COLUMNS[table], **COMMON_COLUMNS)
+    if include_partitions:
+        columns.update(PARTITION_COLUMNS)
+    return pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in columns.items()])
+
+def get_partition_dir(dataset_dir: str, table: str, job: str, build: int) -> str:
+    """Directorio de la partición job/build de una tabla (el job se codifica para la ruta)"""
+    return os.path.join(dataset_dir, table, f"job={quote(job, safe='')}", f"build={build}")
+
+def append_records(table: str, records: List[Dict], source: str,
+                   dataset_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Escribe los registros de `source` (backend, frontend, load_test, ...) en la partición
+    del job y build actuales. El archivo part-<source>.parquet se reemplaza si ya existía,
+    así que volver a ejecutar un reporte en el mismo build no duplica filas.
+    Retorna la ruta del archivo escrito, o None si no se escribió nada.
+    """
+    dataset_dir = dataset_dir or get_dataset_dir()
+    partition_dir = get_partition_dir(dataset_dir, table, get_job_name(), get_build_number())
+    parquet_file = os.path.join(partition_dir, f"part-{source}.parquet")
+
+    if not records:
+        # Sin resultados en esta ejecución: eliminar los de una ejecución anterior del mismo build
+        # y las particiones que queden vacías, para que no cuenten como builds
+        if os.path.exists(parquet_file):
+            os.remove(parquet_file)
+            for directory in (partition_dir, os.path.dirname(partition_dir)):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+        return None
+    if pa is None:
+        print(f"pyarrow no está instalado, se omite la exportación de '{table}'")
+        return None
+
+    recorded_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    rows = [dict(record, recorded_at=recorded_at) for record in records]
+
+    os.makedirs(partition_dir, exist_ok=True)
+    # El prefijo '.' hace que las consultas ignoren el archivo mientras se escribe
+    temp_file = os.path.join(partition_dir, f".part-{source}.parquet.tmp")
+    try:
+        pq.write_table(pa.Table.from_pylist(rows, schema=get_schema(table)), temp_file)
+        os.replace(temp_file, parquet_file)
+    except Exception as e:
+        print(f"Error exportando '{table}' a Parquet: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return None
+
+    print(f"Dataset actualizado: {parquet_file} ({len(rows)} registros)")
+    return parquet_file
+
+def list_partition_values(directory: str, key: str) -> List[str]:
+    """Valores (decodificados) de las particiones key=valor dentro de un directorio"""
+    if not os.path.isdir(directory):
+        return []
+    prefix = f"{key}="
+    return [unquote(name[len(prefix):]) for name in os.listdir(directory) if name.startswith(prefix)]
+
+def list_jobs(table: str, dataset_dir: Optional[str] = None) -> List[str]:
+    """Lista los jobs de una tabla leyendo solo los nombres de las particiones"""
+    return sorted(list_partition_values(os.path.join(dataset_dir or get_dataset_dir(), table), 'job'))
+
+def list_builds(table: str, job: str, dataset_dir: Optional[str] = None) -> List[int]:
+    """
+    Lista los builds de un job en una tabla leyendo solo los nombres de las particiones.
+    Solo cuenta las particiones que contienen al menos un archivo part-*.parquet.
+    """
+    job_dir = os.path.join(dataset_dir or get_dataset_dir(), table, f"job={quote(job, safe='')}")
+    builds = []
+    for value in list_partition_values(job_dir, 'build'):
+        partition_dir = os.path.join(job_dir, f"build={value}")
+        if not os.path.isdir(partition_dir) or not any(
+                name.startswith('part-') and name.endswith('.parquet') for name in os.listdir(partition_dir)):
+            continue
+        try:
+            builds.append(int(value))
+        except ValueError:
+            continue
+    return sorted(builds)
+
+def cast_value(value: str, column: str, schema):
+    """Convierte el valor de un filtro al tipo de la columna en el esquema de la tabla"""
+    if schema.get_field_index(column) < 0:
+        raise ValueError(f"Columna desconocida: {column}")
+    column_type = schema.field(column).type
+    try:
+        if pa.types.is_integer(column_type):
+            return int(value)
+        if pa.types.is_floating(column_type):
+            return float(value)
+    except ValueError:
+        raise ValueError(f"Valor inválido para la columna '{column}' ({column_type}): {value}")
+    return value
+
+def build_filter(conditions: List[str], schema, min_builds: Optional[Dict[str, int]] = None):
+    """
+    Construye la expresión de filtro de pyarrow a partir de condiciones "col<op>valor".
+    `min_builds` limita cada job a sus builds >= al valor indicado. Los filtros sobre
+    'job' y 'build' descartan particiones completas sin leerlas.
+    """
+    expression = None
+    if min_builds is not None:
+        for job, min_build in min_builds.items():
+            current = (ds.field('job') == job) & (ds.field('build') >= min_build)
+            expression = current if expression is None else expression | current
+
+    for condition in conditions:
+        match = WHERE_PATTERN.match(condition)
+        if not match:
+            raise ValueError(f"Condición inválida: {condition}")
+        column, operator, raw_value = match.groups()
+        field = ds.field(column)
+        value = cast_value(raw_value, column, schema)
+
+        if operator == '=':
+            current = field == value
+        elif operator == '!=':
+            current = field != value
+        elif operator == '>=':
+            current = field >= value
+        elif operator == '<=':
+            current = field <= value
+        elif operator == '>':
+            current = field > value
+        else:
+            current = field < value
+
+        expression = current if expression is None else expression & current
+
+    return expression
+
+def query(table: str, columns: Optional[List[str]] = None, conditions: Optional[List[str]] = None,
+          last_builds: Optional[int] = None, job: Optional[str] = None, dataset_dir: Optional[str] = None):
+    """
+    Consulta una tabla del dataset leyendo solo las columnas y particiones necesarias.
+    `last_builds` se aplica por job (los últimos N builds de cada job, o solo de `job`).
+    Retorna una tabla de pyarrow ordenada por job y build.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow no está instalado (pip install pyarrow)")
+    if table not in TABLE_COLUMNS:
+        raise ValueError(f"Tabla desconocida: {table}")
+
+    table_dir = os.path.join(dataset_dir or get_dataset_dir(), table)
+    if not os.path.isdir(table_dir):
+        raise FileNotFoundError(f"No existe la tabla '{table}' en {table_dir}")
+
+    conditions = list(conditions or [])
+    jobs = [job] if job else list_jobs(table, dataset_dir)
+    if job:
+        conditions.append(f"job={job}")
+
+    min_builds = None
+    if last_builds:
+        min_builds = {}
+        for current_job in jobs:
+            builds = list_builds(table, current_job, dataset_dir)
+            if builds:
+                min_builds[current_job] = builds[max(len(builds) - last_builds, 0)]
+
+    schema = get_schema(table, include_partitions=True)
+    for column in columns or []:
+        if schema.get_field_index(column) < 0:
+            raise ValueError(f"Columna desconocida: {column}")
+
+    if min_builds == {}:
+        # Ningún build para los jobs pedidos
+        empty = schema.empty_table()
+        return empty.select(columns) if columns else empty
+
+    partitioning = ds.partitioning(
+        pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in PARTITION_COLUMNS.items()]),
+        flavor='hive'
+    )
+    dataset = ds.dataset(table_dir, schema=schema, format='parquet', partitioning=partitioning)
+    result = dataset.to_table(columns=columns, filter=build_filter(conditions, schema, min_builds))
+
+    sort_keys = [(name, 'ascending') for name in PARTITION_COLUMNS if name in result.column_names]
+    if sort_keys:
+        result = result.sort_by(sort_keys)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description='Consulta el dataset columnar de reportes')
+    parser.add_argument('table', nargs='?', help='Tabla a consultar')
+    parser.add_argument('--columns', help='Columnas separadas por coma')
+    parser.add_argument('--where', action='append', default=[],
+                        help='Filtro "columna<op>valor" (=, !=, >, >=, <, <=). Se puede repetir')
+    parser.add_argument('--job', help='Solo este job (JOB_NAME de Jenkins)')
+    parser.add_argument('--last-builds', type=int, help='Solo los últimos N builds de cada job')
+    parser.add_argument('--dataset-dir', help='Directorio del dataset (por defecto REPORT_DATASET_DIR)')
+    parser.add_argument('--list', action='store_true', help='Lista las tablas, sus jobs y builds')
+    args = parser.parse_args()
+
+    dataset_dir = args.dataset_dir or get_dataset_dir()
+
+    if args.list or not args.table:
+        if not os.path.isdir(dataset_dir):
+            print(f"No existe el dataset en {dataset_dir}")
+            sys.exit(1)
+        for table in sorted(os.listdir(dataset_dir)):
+            jobs = [args.job] if args.job else list_jobs(table, dataset_dir)
+            for job in jobs:
+                builds = list_builds(table, job, dataset_dir)
+                if builds:
+                    print(f"{table} [{job}]: {len(builds)} builds ({builds[0]} - {builds[-1]})")
+        return
+
+    columns = [column.strip() for column in args.columns.split(',')] if args.columns else None
+
+    try:
+        result = query(args.table, columns, args.where, args.last_builds, args.job, dataset_dir)
+    except (RuntimeError, FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(result.column_names)
+    for row in result.to_pylist():
+        writer.writerow([row[column] for column in result.column_names])
+
+if __name__ == '__main__':
+    main()
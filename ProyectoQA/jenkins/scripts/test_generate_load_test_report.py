@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Pruebas de regresión de las series temporales del dashboard de pruebas de carga.
+
+Uso: python -m unittest test_generate_load_test_report (desde jenkins/scripts)
+"""
+import unittest
+
+from generate_load_test_report import (
+    build_time_series,
+    downsample_min_max,
+    render_svg_chart,
+)
+
+def make_windows(keys):
+    return {key: {'elapsed': [100.0], 'errors': 0} for key in keys}
+
+class TimeSeriesTest(unittest.TestCase):
+
+    def test_sparse_series_respects_point_budget(self):
+        # 4 horas con una muestra cada 2 segundos: la mitad de las ventanas están vacías
+        series = build_time_series(make_windows(range(0, 4 * 3600, 2)), 1)
+        points = [(window['timestamp'], window['p95_response_time']) for window in series]
+
+        reduced = downsample_min_max(points, 500)
+
+        self.assertLessEqual(sum(1 for point in reduced if point[1] is not None), 500)
+        svg = render_svg_chart('P95', 'ms', {'P95': reduced})
+        self.assertEqual(svg.count('<path'), 1)
+
+    def test_gap_breaks_line(self):
+        series = build_time_series(make_windows(list(range(0, 100)) + list(range(400, 500))), 1)
+        points = [(window['timestamp'], window['p50_response_time']) for window in series]
+
+        svg = render_svg_chart('P50', 'ms', {'P50': downsample_min_max(points, 500)})
+
+        self.assertEqual(svg.count(' M') + svg.count('"M'), 2)
+
+    def test_isolated_points_are_markers(self):
+        points = [(i, None if i % 2 else 1.0) for i in range(10)]
+
+        svg = render_svg_chart('P50', 'ms', {'P50': downsample_min_max(points, 500)})
+
+        self.assertEqual(svg.count('<circle'), 5)
+        self.assertNotIn('<path', svg)
+
+    def test_outlier_timestamp_does_not_expand_range(self):
+        windows = make_windows(range(1700000000, 1700000100))
+        windows[0] = {'elapsed': [100.0], 'errors': 0}
+
+        series = build_time_series(windows, 1)
+
+        self.assertEqual(len(series), 100)
+
+if __name__ == '__main__':
+    unittest.main()